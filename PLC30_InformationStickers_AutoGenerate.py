@@ -1,24 +1,45 @@
-import math
+import logging
+import os
+import queue
+import shutil
+import sys
+import threading
 import time
-import win32com.client
-from typing import Tuple, Any
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+log = logging.getLogger(__name__)
 
 # ----------------------------------------------------------------------------- #
 # SAFE EXCEL ACCESS
 # ----------------------------------------------------------------------------- #
 
-def safe_cell(ws, row, col, retries=5, delay=0.2):
-    """Safely get a cell value from Excel with retry if COM call is rejected."""
+def safe_range(ws, first_row, first_col, last_row, last_col, retries=5, delay=0.2):
+    """Safely read a rectangular block of cells from Excel in a single COM call.
+
+    Returns a tuple of row tuples indexed ``[row - first_row][col - first_col]``.
+    Retries if the COM call is rejected because Excel is busy.
+    """
     for _ in range(retries):
         try:
-            return ws.Cells(row, col).Value
+            # Value2 skips the date/currency Variant conversion (no date columns here)
+            data = ws.Range(ws.Cells(first_row, first_col), ws.Cells(last_row, last_col)).Value2
+            # A single cell comes back as a scalar rather than a 2D tuple
+            if not isinstance(data, tuple):
+                data = ((data,),)
+            return data
         except Exception as e:
             if "Call was rejected by callee" in str(e):
                 time.sleep(delay)
                 continue
             else:
                 raise
-    raise RuntimeError(f"Excel did not respond after {retries} retries for cell ({row}, {col})")
+    raise RuntimeError(
+        f"Excel did not respond after {retries} retries for range "
+        f"({first_row}, {first_col}):({last_row}, {last_col})"
+    )
 
 # ----------------------------------------------------------------------------- #
 # IMPORTS
@@ -35,6 +56,13 @@ except Exception:
             )
     win32 = _Win32Stub()
 
+try:
+    import pythoncom  # type: ignore
+    import pywintypes  # type: ignore
+except Exception:
+    pythoncom = None
+    pywintypes = None
+
 # ----------------------------------------------------------------------------- #
 # CONFIGURATION
 # ----------------------------------------------------------------------------- #
@@ -42,10 +70,24 @@ except Exception:
 excel_file_path: str = r"C:\LOTO PLACARDS FC08\LOTO Updating Tool FCO8.xlsm"
 ppt_file_url: str = r"C:\LOTO PLACARDS FC08\PLC30 - Inbound 1\03. LOTO Information Sticker\PLC30 LOTO Information 114 Stickers_Template.pptx"
 
+sheet_name: str = "Info_Tags_PLC30_FCO8"
+
 stickers_per_slide: int = 6
 total_stickers: int = 120
 
+# Sticker data block: one row per sticker from row 3, columns I..N (9..14)
+FIRST_DATA_ROW: int = 3
+FIRST_DATA_COL: int = 9
+LAST_DATA_COL: int = 14
+
 FORCE_COORDS: bool = False  # if True, apply computed left/top/width/height
+COORD_TOLERANCE: float = 0.01  # points; coordinates closer than this count as unchanged
+VERBOSE: bool = False  # if True, log every shape write (slow on Windows consoles)
+
+# Helper process (run with --serve, use with --via-helper) that keeps Excel/PowerPoint
+# attached between runs. One named pipe per script so PLC30/PLC40 helpers never mix.
+SERVER_ADDRESS: str = "\\\\.\\pipe\\" + Path(__file__).stem
+SERVER_AUTHKEY: bytes = b"loto-stickers"
 
 # Layout for A4 (approx, points)
 BASE_LEFTS = [2, 507]      # left X for column 0 and 1 (points)
@@ -59,30 +101,78 @@ POINT_FONT_SIZE = 20
 LOTO_FONT_SIZE = 22
 CABINET_FONT_SIZE = 10
 
+# Widen the cabinet text box to avoid text wrapping on points (~40 points, change this if needed)
+POINT_BOX_SIZE: Tuple[float, float] = (CABINET_SIZE[0] + 40, CABINET_SIZE[1])
+
+# One entry per sticker shape: (name template, Excel column, FORCE_COORDS size,
+# font size or None, apply font even without FORCE_COORDS)
+# Point ##.01..04 <- I..L, LOTO Amount ## <- M, Cabinet ## <- N
+SHAPE_SPECS: List[Tuple[str, int, Tuple[float, float], Any, bool]] = (
+    [(f"Point {{s}}.{i:02d}", 8 + i, POINT_BOX_SIZE, None, False) for i in range(1, 5)]
+    + [
+        ("LOTO Amount {s}", 13, LOTO_SIZE, LOTO_FONT_SIZE, False),
+        ("Cabinet {s}", 14, CABINET_SIZE, CABINET_FONT_SIZE, True),
+    ]
+)
+
+# Office enumeration values (avoid depending on generated win32com constants)
+MSO_AUTOMATION_SECURITY_FORCE_DISABLE = 3
+PP_ALERTS_NONE = 1
+
 # ----------------------------------------------------------------------------- #
 # HELPERS
 # ----------------------------------------------------------------------------- #
 
-import shutil, os, win32com.client
-
-genpy = os.path.join(os.environ.get("LOCALAPPDATA", ""), "Temp", "gen_py")
-if os.path.exists(genpy):
-    print("🧹 Clearing old gen_py cache...")
-    shutil.rmtree(genpy, ignore_errors=True)
+def ensure_dispatch(target: Any) -> Any:
+    """gencache.EnsureDispatch, clearing the gen_py cache once if it is stale.
 
-win32com.client.gencache.Rebuild()
+    A corrupt or outdated generated module surfaces as an AttributeError; in
+    that case wipe gen_py, forget the loaded wrappers and generate them again.
+    """
+    gencache = win32.gencache
+    try:
+        return gencache.EnsureDispatch(target)
+    except AttributeError:
+        log.warning("🧹 Clearing stale gen_py cache...")
+        shutil.rmtree(gencache.GetGeneratePath(), ignore_errors=True)
+        gencache.GetGeneratePath()  # recreate the empty package
+        gencache.clsidToTypelib.clear()
+        for mod in [m for m in sys.modules if m.startswith("win32com.gen_py.")]:
+            del sys.modules[mod]
+        return gencache.EnsureDispatch(target)
 
 def attach_office(app_name: str):
-    """Attach to a running COM application or start it using EnsureDispatch."""
+    """Attach to a running COM application or start it, with early binding.
+
+    The dispatch is wrapped with the cached gen_py type library, so member
+    access goes through dispatch IDs instead of a GetIDsOfNames lookup per
+    call. Applications without type info are used late-bound instead.
+    """
+    prog_id = f"{app_name}.Application"
+    try:
+        # Raw IDispatch: win32.GetActiveObject would already look up the cached
+        # gen_py wrapper, so a stale cache would look like "not running"
+        target = pythoncom.GetActiveObject(pywintypes.IID(prog_id)).QueryInterface(
+            pythoncom.IID_IDispatch
+        )
+        started = False
+    except pythoncom.com_error:
+        target = prog_id
+        started = True
+
     try:
-        return win32.GetActiveObject(f"{app_name}.Application")
-    except Exception:
         try:
-            app = win32.gencache.EnsureDispatch(f"{app_name}.Application")
-            app.Visible = True
-            return app
-        except Exception as e:
-            raise RuntimeError(f"Failed to start/attach to {app_name}: {e}")
+            app = ensure_dispatch(target)
+        except TypeError:
+            # EnsureDispatch raises TypeError when the object has no type library
+            log.warning("⚠️ %s exposes no type info; using late binding", app_name)
+            app = win32.Dispatch(target)
+    except Exception as e:
+        raise RuntimeError(f"Failed to start/attach to {app_name}: {e}")
+
+    if started:
+        app.Visible = True
+    return app
 
 def coords_for_position(pos_index: int, size: Tuple[float, float]) -> Tuple[float, float, float, float]:
     idx = pos_index - 1
@@ -93,58 +183,226 @@ def coords_for_position(pos_index: int, size: Tuple[float, float]) -> Tuple[floa
     width, height = size
     return (left, top, width, height)
 
+COORD_PROPS = ("Left", "Top", "Width", "Height")
+
+def stale_coords(shp: Any, coords) -> Dict[str, float]:
+    """Return {property: target} for the coordinates of `shp` that need writing.
+
+    PowerPoint stores coordinates as Single, so values are compared with
+    COORD_TOLERANCE rather than exactly.
+    """
+    return {
+        prop: value for prop, value in zip(COORD_PROPS, coords)
+        if abs(getattr(shp, prop) - value) > COORD_TOLERANCE
+    }
+
 def apply_coords(shp, coords):
-    left, top, width, height = coords
-    shp.Left = left
-    shp.Top = top
-    shp.Width = width
-    shp.Height = height
-
-def apply_font_size(shp: Any, size_pt: int) -> None:
-    """Apply font size to the shape text range if possible."""
+    """Set position/size on a shape, writing only the properties that differ."""
+    for prop, value in stale_coords(shp, coords).items():
+        setattr(shp, prop, value)
+
+def apply_coords_range(slide: Any, shapes: List[Tuple[str, Any]], coords) -> None:
+    """Set the same position/size on several (name, shape) pairs.
+
+    Each shape's coordinates are read once. Shapes already in place are
+    left alone, a single stale shape gets only its differing properties
+    written, and several go through one ShapeRange, where each property
+    write applies to every member at once.
+    """
+    stale = []
+    for name, shp in shapes:
+        props = stale_coords(shp, coords)
+        if props:
+            stale.append((name, shp, props))
+    if not stale:
+        return
+    if len(stale) == 1:
+        _, shp, props = stale[0]
+        for prop, value in props.items():
+            setattr(shp, prop, value)
+        return
+
+    # Write each property that is stale on any member, once for the whole range
+    pending: Dict[str, float] = {}
+    for _, _, props in stale:
+        pending.update(props)
+    rng = slide.Shapes.Range([name for name, _, _ in stale])
+    for prop, value in pending.items():
+        setattr(rng, prop, value)
+
+def clean_value(val: Any) -> str:
+    """Convert an Excel cell value to the text shown on the sticker."""
+    if val is None or str(val).strip() in ("", "nan", "None"):
+        return ""
+    # Convert numbers like 1.0 → 1, 2.50 → 2.5 (Value2 returns every number as a float)
+    if isinstance(val, (int, float)):
+        if float(val).is_integer():
+            return str(int(val))
+        return str(round(val, 2))
+    return str(val).strip()
+
+# set_shape_text outcomes
+TEXT_UPDATED = "updated"
+TEXT_UNCHANGED = "unchanged"
+TEXT_VERTICAL = "vertical"
+TEXT_FAILED = "failed"
+
+def set_shape_text(shp: Any, text: str, name: str) -> Tuple[Any, str]:
+    """Write text into a shape, skipping vertical text boxes and unchanged text.
+
+    Returns the shape's TextRange (or None) so callers can reuse it instead
+    of walking the TextFrame chain again, and one of the TEXT_* outcomes.
+    Re-runs against an already-filled deck then cost one read per shape and
+    no writes (no PowerPoint redraw or undo entries).
+    """
     try:
         tf = shp.TextFrame
-        if tf is not None:
-            rng = tf.TextRange
-            if rng is not None and hasattr(rng, "Font"):
-                rng.Font.Size = size_pt
-    except Exception:
-        pass
-
-def safe_shape(slide: Any, name: str):
-    """Return shape by name, or None if not present."""
+        # Skip overwriting vertical text boxes
+        if tf.Orientation in (3, 4):
+            return None, TEXT_VERTICAL
+        rng = tf.TextRange
+        # PowerPoint stores line breaks as "\r"; match that so Alt+Enter cells compare equal
+        text = text.replace("\r\n", "\r").replace("\n", "\r")
+        if rng.Text != text:
+            rng.Text = text
+            return rng, TEXT_UPDATED
+        return rng, TEXT_UNCHANGED
+    except Exception as e:
+        log.warning("⚠️ Failed to write text to %s: %s", name, e)
+        return None, TEXT_FAILED
+
+def log_slide_summary(slide_index: int, counts: Dict[str, int]) -> None:
+    """Log the per-slide tally of set_shape_text outcomes."""
+    log.info(
+        "✅ Slide %d: %d shapes updated, %d unchanged, %d vertical skipped, %d failed",
+        slide_index, counts[TEXT_UPDATED], counts[TEXT_UNCHANGED],
+        counts[TEXT_VERTICAL], counts[TEXT_FAILED],
+    )
+
+def apply_font_size(shp: Any, size_pt: int, rng: Any = None) -> None:
+    """Apply font size to the shape text range if possible (and not already set)."""
     try:
-        return slide.Shapes(name)
+        if rng is None:
+            tf = shp.TextFrame
+            if tf is not None:
+                rng = tf.TextRange
+        if rng is not None and hasattr(rng, "Font"):
+            font = rng.Font
+            if font.Size != size_pt:
+                font.Size = size_pt
     except Exception:
-        return None
-
-# ----------------------------------------------------------------------------- #
-# MAIN
-# ----------------------------------------------------------------------------- #
-
-def main() -> None:
-
-    win32com.client.gencache.Rebuild()
-
-    # Attach to Excel
-    excel = attach_office("Excel")
+        pass
 
-    # Open or get workbook
+def slide_shape_map(slide: Any) -> Dict[str, Any]:
+    """Return a {name: shape} snapshot of all shapes on a slide.
+
+    Like slide.Shapes(name), the first shape with a given name wins;
+    duplicates are reported so they can be renamed in the template.
+    """
+    shape_map: Dict[str, Any] = {}
+    for shp in slide.Shapes:
+        name = shp.Name
+        if name in shape_map:
+            log.warning("⚠️ Duplicate shape name: %s on slide %d (using the first one)", name, slide.SlideIndex)
+            continue
+        shape_map[name] = shp
+    return shape_map
+
+def find_open_workbook(excel: Any, path: str) -> Any:
+    """Return the workbook already open in Excel at `path`, or None."""
+    wanted = os.path.normcase(os.path.abspath(path))
+    for wb in excel.Workbooks:
+        if os.path.normcase(wb.FullName) == wanted:
+            return wb
+    return None
+
+def open_workbook(excel: Any) -> Tuple[Any, bool]:
+    """Return the source workbook and whether this call opened it.
+
+    A workbook the user already has open (or the active one if no path is
+    set) is reused as-is; otherwise it is opened read-only.
+    """
     try:
-        if excel_file_path:
-            wb = excel.Workbooks.Open(excel_file_path)
-        else:
-            wb = excel.ActiveWorkbook
+        if not excel_file_path:
+            return excel.ActiveWorkbook, False
+
+        wb = find_open_workbook(excel, excel_file_path)
+        if wb is not None:
+            return wb, False
+
+        # We only read cells, so skip link updates, auto-open macros, the
+        # write lock and the MRU list
+        prev_security = excel.AutomationSecurity
+        prev_ask_links = excel.AskToUpdateLinks
+        excel.AskToUpdateLinks = False
+        excel.AutomationSecurity = MSO_AUTOMATION_SECURITY_FORCE_DISABLE
+        try:
+            wb = excel.Workbooks.Open(
+                Filename=excel_file_path, UpdateLinks=0, ReadOnly=True, AddToMru=False
+            )
+        finally:
+            excel.AutomationSecurity = prev_security
+            excel.AskToUpdateLinks = prev_ask_links
+        return wb, True
     except Exception as e:
         raise RuntimeError(
             "Failed to open workbook. If it's on SharePoint/OneDrive, "
             "sync locally or ensure Office is authenticated. " + str(e)
         )
 
-    ws = wb.Sheets("Info_Tags_PLC30_FCO8")
+def read_sticker_data(excel: Any) -> Tuple[Tuple[Any, ...], ...]:
+    """Bulk-read the sticker data block, closing the workbook again if we opened it.
+
+    Leaving a read-only copy open would block the user from editing the file
+    and make later runs (e.g. through the helper) read stale data.
+    """
+    wb, opened = open_workbook(excel)
+    try:
+        ws = wb.Sheets(sheet_name)
+        return safe_range(
+            ws, FIRST_DATA_ROW, FIRST_DATA_COL, FIRST_DATA_ROW + total_stickers - 1, LAST_DATA_COL
+        )
+    finally:
+        if opened:
+            wb.Close(SaveChanges=False)
+
+def excel_reader(excel_stream: Any, results: "queue.Queue[Any]") -> None:
+    """Worker thread: read the Excel data and hand it (or the error) to the main thread.
+
+    COM objects are apartment-bound, so the Excel pointer arrives marshalled
+    in a stream and is unpacked inside this thread's own apartment. Plain
+    Dispatch reuses the wrapper the main thread already generated (or stays
+    late-bound) and never touches the gen_py cache from this thread.
+    """
+    pythoncom.CoInitialize()
+    try:
+        excel = win32.Dispatch(
+            pythoncom.CoGetInterfaceAndReleaseStream(excel_stream, pythoncom.IID_IDispatch)
+        )
+        try:
+            results.put(read_sticker_data(excel))
+        finally:
+            del excel
+    except Exception as e:
+        results.put(e)
+    finally:
+        pythoncom.CoUninitialize()
+
+# ----------------------------------------------------------------------------- #
+# MAIN
+# ----------------------------------------------------------------------------- #
+
+def update_stickers(excel: Any, ppt: Any) -> None:
+    """Fill the sticker deck from the workbook using already-attached Office apps."""
+
+    # Read Excel on a worker thread while PowerPoint opens the presentation
+    excel_stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+        pythoncom.IID_IDispatch, excel._oleobj_
+    )
+    results: "queue.Queue[Any]" = queue.Queue(maxsize=1)
+    reader = threading.Thread(target=excel_reader, args=(excel_stream, results), daemon=True)
+    reader.start()
 
-    # Attach to PowerPoint and open presentation
-    ppt = attach_office("PowerPoint")
     try:
         ppt_pres = ppt.Presentations.Open(ppt_file_url, WithWindow=True)
     except Exception as e:
@@ -152,116 +410,184 @@ def main() -> None:
             "Failed to open PowerPoint file. Ensure path/URL is reachable by PowerPoint: " + str(e)
         )
 
-    # Iterate rows and update shapes
-    for data_row in range(3, total_stickers + 3):  # rows 3 .. total_stickers+2
-        sticker_index = data_row - 2
-        sticker_str = f"{sticker_index:02d}"
-        slide_index = math.ceil(sticker_index / stickers_per_slide)
-
-        if slide_index > ppt_pres.Slides.Count:
-            print(f"⚠️ Slide {slide_index} missing for sticker {sticker_str}")
-            continue
-
-        slide = ppt_pres.Slides(slide_index)
-        pos_in_slide = ((sticker_index - 1) % stickers_per_slide) + 1  # 1..6
+    # Wait for the Excel data block
+    data = results.get()
+    reader.join()
+    if isinstance(data, Exception):
+        raise data
 
-        # POINTS (Point ##.01 .. Point ##.04) from Excel cols I..L (9..12)
-        for col, point_num in zip(range(9, 13), range(1, 5)):
-            idx_str = f"{point_num:02d}"  # 01..04
-            name = f"Point {sticker_str}.{idx_str}"
-            shp = safe_shape(slide, name)
-            if shp is None:
-                print(f"⚠️ Missing shape: {name} on slide {slide_index}")
+    # Silence PowerPoint alerts while we write
+    prev_ppt_alerts = ppt.DisplayAlerts
+    ppt.DisplayAlerts = PP_ALERTS_NONE
+    try:
+        # Per-sticker labels and slide/position indices (sticker 1 -> index 0)
+        sticker_strs = [f"{i:02d}" for i in range(1, total_stickers + 1)]
+        slide_indices = [(i - 1) // stickers_per_slide + 1 for i in range(1, total_stickers + 1)]
+        positions = [(i - 1) % stickers_per_slide + 1 for i in range(1, total_stickers + 1)]  # 1..6
+        sticker_names = [[spec[0].format(s=s) for spec in SHAPE_SPECS] for s in sticker_strs]
+
+        slide_count = ppt_pres.Slides.Count
+        current_slide_index = None
+        slide_counts: Dict[str, int] = {}
+        slide = None
+        shape_map: Dict[str, Any] = {}
+        get_shape = shape_map.get
+
+        # Iterate rows and update shapes
+        for i, row_values in enumerate(data):  # i = sticker_index - 1
+            data_row = FIRST_DATA_ROW + i
+            sticker_str = sticker_strs[i]
+            slide_index = slide_indices[i]
+
+            if slide_index > slide_count:
+                log.warning("⚠️ Slide %d missing for sticker %s", slide_index, sticker_str)
                 continue
 
-            val = safe_cell(ws, data_row, col)
-
-            # --- CLEAN VALUE ---
-            val_text = ""
-            if val is not None and str(val).strip() not in ["", "nan", "None"]:
-                # Convert numbers like 1.0 → 1, 2.50 → 2.5
-                if isinstance(val, (int, float)):
-                    if float(val).is_integer():
-                        val_text = str(int(val))
-                    else:
-                        val_text = str(round(val, 2))
-                else:
-                    val_text = str(val).strip()
-
-            print(f"  ✅ Set {name} (row {data_row}, col {col}) → \"{val_text}\"")
-
-            # Skip overwriting vertical text boxes
-            try:
-                if shp.TextFrame.Orientation not in (3, 4):
-                    shp.TextFrame.TextRange.Text = val_text
-            except Exception:
-                pass
-
-            if FORCE_COORDS:
-                # Widen the cabinet text box to avoid text wrapping
-                left, top, width, height = coords_for_position(pos_in_slide, CABINET_SIZE)
-                apply_coords(shp, (left, top, width + 40, height))  # add ~40 points width change this if needed
-
-        # LOTO Amount (Column M = 13)
-        name = f"LOTO Amount {sticker_str}"
-        shp = safe_shape(slide, name)
-        if shp is None:
-            print(f"⚠️ Missing shape: {name} on slide {slide_index}")
-        else:
-            val = safe_cell(ws, data_row, 13)
-            val_text = ""
-            if val is not None and str(val).strip() not in ["", "nan", "None"]:
-                if isinstance(val, (int, float)):
-                    if float(val).is_integer():
-                        val_text = str(int(val))
-                    else:
-                        val_text = str(round(val, 2))
-                else:
-                    val_text = str(val).strip()
-
-            print(f"  ✅ Set {name} (row {data_row}, col 13) → \"{val_text}\"")
-
-            try:
-                if shp.TextFrame.Orientation not in (3, 4):
-                    shp.TextFrame.TextRange.Text = val_text
-            except Exception:
-                pass
-
-            if FORCE_COORDS:
-                apply_coords(shp, coords_for_position(pos_in_slide, LOTO_SIZE))
-                apply_font_size(shp, LOTO_FONT_SIZE)
-
-        # Cabinet (Column N = 14)
-        name = f"Cabinet {sticker_str}"
-        shp = safe_shape(slide, name)
-        if shp is None:
-            print(f"⚠️ Missing shape: {name} on slide {slide_index}")
-        else:
-            val = safe_cell(ws, data_row, 14)
-            val_text = ""
-            if val is not None and str(val).strip() not in ["", "nan", "None"]:
-                if isinstance(val, (int, float)):
-                    if float(val).is_integer():
-                        val_text = str(int(val))
-                    else:
-                        val_text = str(round(val, 2))
-                else:
-                    val_text = str(val).strip()
-
-            print(f"  ✅ Set {name} (row {data_row}, col 14) → \"{val_text}\"")
-
+            if slide_index != current_slide_index:
+                if current_slide_index is not None:
+                    log_slide_summary(current_slide_index, slide_counts)
+                slide_counts = dict.fromkeys((TEXT_UPDATED, TEXT_UNCHANGED, TEXT_VERTICAL, TEXT_FAILED), 0)
+                slide = ppt_pres.Slides(slide_index)
+                shape_map = slide_shape_map(slide)
+                get_shape = shape_map.get
+                current_slide_index = slide_index
+            pos_in_slide = positions[i]
+            names = sticker_names[i]
+
+            # Same coordinates -> one ShapeRange write (all points of a sticker share a box)
+            coords_groups: Dict[Tuple[float, float, float, float], List[Tuple[str, Any]]] = {}
+            for name, (_, col, size, font_size, font_always) in zip(names, SHAPE_SPECS):
+                shp = get_shape(name)
+                if shp is None:
+                    log.warning("⚠️ Missing shape: %s on slide %d", name, slide_index)
+                    continue
+
+                val_text = clean_value(row_values[col - FIRST_DATA_COL])
+
+                rng, status = set_shape_text(shp, val_text, name)
+                slide_counts[status] += 1
+                if status == TEXT_UPDATED:
+                    log.debug('  ✅ Set %s (row %d, col %d) → "%s"', name, data_row, col, val_text)
+
+                if FORCE_COORDS:
+                    coords_groups.setdefault(coords_for_position(pos_in_slide, size), []).append((name, shp))
+                if font_size is not None and (FORCE_COORDS or font_always):
+                    apply_font_size(shp, font_size, rng)
+
+            for coords, group in coords_groups.items():
+                apply_coords_range(slide, group, coords)
+
+        if current_slide_index is not None:
+            log_slide_summary(current_slide_index, slide_counts)
+    finally:
+        try:
+            ppt.DisplayAlerts = prev_ppt_alerts
+        except Exception:
+            pass
+
+    log.info("✅ LOTO stickers updated successfully!")
+
+def current_config() -> Dict[str, Any]:
+    """Settings a helper must share with its client to do the client's job."""
+    return {
+        "excel_file_path": excel_file_path,
+        "ppt_file_url": ppt_file_url,
+        "sheet_name": sheet_name,
+        "stickers_per_slide": stickers_per_slide,
+        "total_stickers": total_stickers,
+        "FORCE_COORDS": FORCE_COORDS,
+    }
+
+def caused_by_com_error(exc: BaseException) -> bool:
+    """True if `exc` is, or was raised while handling, a pythoncom.com_error."""
+    while exc is not None:
+        if isinstance(exc, pythoncom.com_error):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+def handle_request(request: Any, apps: Dict[str, Any]) -> str:
+    """Run one helper request and return the reply to send back.
+
+    `apps` holds the attached "Excel"/"PowerPoint" handles. If a COM call
+    fails (e.g. the user quit one of the apps since the last request),
+    both are re-attached in place and the update is retried once.
+    """
+    if not (isinstance(request, tuple) and len(request) == 2 and request[0] == "update"):
+        return "error: unknown request"
+    if request[1] != current_config():
+        return "error: helper was started with a different configuration; restart it with --serve"
+    try:
+        try:
+            update_stickers(apps["Excel"], apps["PowerPoint"])
+        except Exception as e:
+            if not caused_by_com_error(e):
+                raise
+            log.warning("⚠️ Office call failed (%s); re-attaching and retrying", e)
+            for app_name in apps:
+                apps[app_name] = attach_office(app_name)
+            update_stickers(apps["Excel"], apps["PowerPoint"])
+        return "ok"
+    except Exception as e:
+        log.exception("❌ Sticker update failed")
+        return f"error: {e}"
+
+def serve() -> None:
+    """Keep Excel and PowerPoint attached and run an update for every client request.
+
+    Office start-up and attachment is paid once here instead of on every run;
+    runs started with --via-helper hand their job to this process. The
+    configuration is loaded once at start-up, so requests from a client
+    whose settings differ are refused rather than run with stale paths.
+    """
+    apps = {app_name: attach_office(app_name) for app_name in ("Excel", "PowerPoint")}
+
+    with Listener(SERVER_ADDRESS, authkey=SERVER_AUTHKEY) as listener:
+        log.info("🟢 Sticker helper listening on %s", SERVER_ADDRESS)
+        while True:
             try:
-                if shp.TextFrame.Orientation not in (3, 4):
-                    shp.TextFrame.TextRange.Text = val_text
-            except Exception:
-                pass
-
-            if FORCE_COORDS:
-                apply_coords(shp, coords_for_position(pos_in_slide, CABINET_SIZE))
-            apply_font_size(shp, CABINET_FONT_SIZE)
+                conn = listener.accept()
+            except (OSError, AuthenticationError) as e:
+                log.warning("⚠️ Rejected helper connection: %s", e)
+                continue
+            with conn:
+                try:
+                    request = conn.recv()
+                    conn.send(handle_request(request, apps))
+                except (EOFError, OSError) as e:
+                    log.warning("⚠️ Helper client disconnected: %s", e)
+
+def request_update() -> bool:
+    """Ask a running helper process to do the update; return False if it could not."""
+    try:
+        with Client(SERVER_ADDRESS, authkey=SERVER_AUTHKEY) as conn:
+            conn.send(("update", current_config()))
+            reply = conn.recv()
+    except (EOFError, OSError, AuthenticationError) as e:
+        log.warning("⚠️ Sticker helper not reachable (%s); updating in-process", e)
+        return False
+    if reply != "ok":
+        log.warning("⚠️ Sticker helper failed (%s); updating in-process", reply)
+        return False
+    log.info("✅ LOTO stickers updated by helper process")
+    return True
+
+def main(via_helper: bool = False) -> None:
+
+    # Hand the job to the helper process if asked to and one is running
+    if via_helper and request_update():
+        return
+
+    # Attach to Excel and PowerPoint
+    excel = attach_office("Excel")
+    ppt = attach_office("PowerPoint")
 
-    print("✅ LOTO stickers updated successfully!")
+    update_stickers(excel, ppt)
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.DEBUG if VERBOSE else logging.INFO, format="%(message)s")
+    if "--serve" in sys.argv[1:]:
+        serve()
+    else:
+        main(via_helper="--via-helper" in sys.argv[1:])